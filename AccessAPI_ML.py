@@ -4,13 +4,1049 @@ extrair informações relacionadas a vendas e produtos. Ela encapsula as chamada
 gerencia a autenticação e a paginação.
 """
 import requests
+import asyncio
+import importlib.util
+import itertools
 import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    # json.loads também aceita bytes, então serve como substituto direto
+    orjson = json
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: sem trava entre processos, a escrita continua atômica
+    fcntl = None
+
+# Com brotli (ou brotlicffi) instalado, urllib3 e aiohttp descompactam respostas "br"
+if importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi'):
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+else:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36"
+_ORDER_DATE_FMT_FROM = "{}T00:00:00.000-00:00"
+_ORDER_DATE_FMT_TO = "{}T23:59:59.000-00:00"
+_PAID_PARAMS = MappingProxyType({'order.status': 'paid'})
+_PRICE_ASC_PARAMS = MappingProxyType({'sort': 'price_asc'})
+
+
+def _com_atributos(params, fields):
+    """
+    Acrescenta o parâmetro "attributes" aos parâmetros da requisição, limitando os campos retornados pela API.
+
+    Argumentos:
+        params: parâmetros da requisição
+        fields: campos desejados (lista ou string separada por vírgulas); None mantém a resposta completa
+
+    Retorno:
+        os próprios parâmetros
+    """
+    if fields:
+        params['attributes'] = fields if isinstance(fields, str) else ','.join(fields)
+    return params
+
+
+class MercadoLivreAuthError(Exception):
+    """
+    Erro retornado pelo endpoint oauth/token (ex.: invalid_grant para um refresh_token revogado).
+    """
+
+
+class _TokenStore:
+    """
+    Guarda os tokens de um client_id entre execuções no arquivo JSON informado e controla a
+    rotação do refresh_token. Usado pelas duas classes de acesso, que assim compartilham o
+    mesmo refresh_token rotacionado.
+
+    Cada entrada registra em "origem" o refresh_token recebido do usuário que iniciou a cadeia
+    de rotações; se o usuário passar outro refresh_token (ex.: após reautorizar o aplicativo),
+    a entrada em disco é ignorada.
+    """
+
+    def __init__(self, caminho, client_id):
+        """
+        O construtor da classe.
+
+        Argumentos:
+            caminho: arquivo de tokens; None mantém os tokens apenas em memória
+            client_id: código do aplicativo, usado como chave no arquivo
+
+        Retorno:
+
+        """
+        self.caminho = caminho
+        self.client_id = str(client_id)
+        self._memoria = None
+
+    @contextmanager
+    def trava(self):
+        """
+        Trava exclusiva (fcntl.flock) que serializa entre processos a leitura, renovação e gravação do token em disco.
+
+        Argumentos:
+
+        Retorno:
+
+        """
+        if self.caminho is None or fcntl is None:
+            yield
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.caminho), exist_ok=True)
+            arquivo = open(self.caminho + '.lock', 'a')
+        except OSError:
+            yield
+            return
+
+        with arquivo:
+            fcntl.flock(arquivo, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(arquivo, fcntl.LOCK_UN)
+
+    def _ler_arquivo(self):
+        """
+        Lê o arquivo de tokens.
+
+        Argumentos:
+
+        Retorno:
+            dicionário {client_id: entrada}; vazio se o arquivo não existir ou estiver corrompido
+        """
+        try:
+            with open(self.caminho, 'rb') as arquivo:
+                tokens = orjson.loads(arquivo.read())
+        except (OSError, ValueError):
+            return {}
+        return tokens if isinstance(tokens, dict) else {}
+
+    def carregar(self, origem):
+        """
+        Busca o token do client_id, mesmo que o access_token já tenha expirado.
+
+        Argumentos:
+            origem: refresh_token recebido do usuário; entradas derivadas de outro são ignoradas
+
+        Retorno:
+            entrada com access_token, refresh_token, expiry e origem, ou None
+        """
+        entrada = self._memoria
+        if self.caminho is not None:
+            entrada = self._ler_arquivo().get(self.client_id) or entrada
+        if not isinstance(entrada, dict) or entrada.get('origem') != origem:
+            return None
+        return entrada
+
+    def gravar(self, entrada):
+        """
+        Grava o token do client_id de forma atômica (arquivo temporário + os.replace),
+        preservando as entradas de outros client_id.
+
+        Argumentos:
+            entrada: dicionário com access_token, refresh_token, expiry e origem
+
+        Retorno:
+
+        """
+        self._memoria = entrada
+        if self.caminho is None:
+            return
+        tokens = self._ler_arquivo()
+        tokens[self.client_id] = entrada
+        diretorio = os.path.dirname(self.caminho)
+        try:
+            os.makedirs(diretorio, exist_ok=True)
+            fd, temporario = tempfile.mkstemp(dir=diretorio, suffix='.tmp')
+            with os.fdopen(fd, 'w') as arquivo:
+                json.dump(tokens, arquivo)
+            os.replace(temporario, self.caminho)
+        except OSError:
+            # O arquivo é apenas uma otimização; a entrada continua disponível em memória
+            pass
+
+    def obter(self, origem, solicitar, usar_cache=True):
+        """
+        Retorna um token válido para o client_id. Um access_token guardado com mais de 60 segundos
+        de validade é reaproveitado; caso contrário um novo é pedido com o refresh_token mais recente
+        da cadeia (o guardado, ou origem). Se o refresh_token guardado for recusado, tenta
+        novamente com origem. O token obtido é gravado com o novo refresh_token rotacionado.
+
+        Argumentos:
+            origem: refresh_token recebido do usuário
+            solicitar: função que recebe um refresh_token e retorna a resposta do endpoint oauth/token
+            usar_cache: False ignora o access_token guardado (ex.: após um 401)
+
+        Retorno:
+            entrada com access_token, refresh_token, expiry e origem
+        """
+        with self.trava():
+            entrada = self.carregar(origem)
+            if usar_cache and entrada is not None and entrada.get('expiry', 0) > time.time() + 60:
+                return entrada
+
+            refresh_token = entrada['refresh_token'] if entrada is not None else origem
+            token = solicitar(refresh_token)
+            if 'access_token' not in token and refresh_token != origem:
+                token = solicitar(origem)
+            if 'access_token' not in token:
+                raise MercadoLivreAuthError(
+                    f"Falha ao obter token de acesso: {token.get('error')} - {token.get('message')}"
+                )
+
+            entrada = {
+                'access_token': token['access_token'],
+                # O Mercado Livre invalida o refresh_token usado e devolve um novo
+                'refresh_token': token.get('refresh_token', refresh_token),
+                'expiry': time.time() + token.get('expires_in', 21600),
+                'origem': origem
+            }
+            self.gravar(entrada)
+            return entrada
+
+
+class _TokenBucket:
+    """
+    Limitador de taxa (token bucket) compartilhado entre as threads de uma instância.
+    Após um 429 a taxa cai pela metade por 30 segundos e depois volta linearmente ao normal
+    nos 30 segundos seguintes.
+    """
+
+    def __init__(self, capacity=10, refill_rate=10, penalidade=30):
+        """
+        O construtor da classe, que inicia o balde cheio.
+
+        Argumentos:
+            capacity: quantidade máxima de requisições em rajada
+            refill_rate: requisições por segundo em regime normal
+            penalidade: duração (segundos) de cada fase da desaceleração após um 429
+
+        Retorno:
+
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.penalidade = penalidade
+        self._tokens = capacity
+        self._ultimo = time.monotonic()
+        self._penalizado_em = None
+        self._lock = threading.Lock()
+
+    def _taxa_atual(self, agora):
+        """
+        Retorna a taxa de reposição vigente, considerando a desaceleração após um 429.
+
+        Argumentos:
+            agora: instante atual (time.monotonic)
+
+        Retorno:
+            requisições por segundo
+        """
+        if self._penalizado_em is None:
+            return self.refill_rate
+        decorrido = agora - self._penalizado_em
+        if decorrido < self.penalidade:
+            return self.refill_rate / 2
+        if decorrido < 2 * self.penalidade:
+            return self.refill_rate / 2 * (1 + (decorrido - self.penalidade) / self.penalidade)
+        self._penalizado_em = None
+        return self.refill_rate
+
+    def _reservar(self):
+        """
+        Consome um token, aceitando saldo negativo, e retorna quanto tempo esperar até que ele exista.
+
+        Argumentos:
+
+        Retorno:
+            espera em segundos (0 se havia token disponível)
+        """
+        with self._lock:
+            agora = time.monotonic()
+            taxa = self._taxa_atual(agora)
+            self._tokens = min(self.capacity, self._tokens + (agora - self._ultimo) * taxa)
+            self._ultimo = agora
+            self._tokens -= 1
+            return -self._tokens / taxa if self._tokens < 0 else 0
+
+    def acquire(self):
+        """
+        Bloqueia a thread até haver um token disponível.
+
+        Argumentos:
+
+        Retorno:
+
+        """
+        espera = self._reservar()
+        if espera:
+            time.sleep(espera)
+
+    async def acquire_async(self):
+        """
+        Equivalente assíncrono de acquire, sem bloquear o event loop.
+
+        Argumentos:
+
+        Retorno:
+
+        """
+        espera = self._reservar()
+        if espera:
+            await asyncio.sleep(espera)
+
+    def penalize(self):
+        """
+        Reduz a taxa após uma resposta 429.
+
+        Argumentos:
+
+        Retorno:
+
+        """
+        with self._lock:
+            self._penalizado_em = time.monotonic()
+            self._tokens = min(self._tokens, 0)
+
 
 class AccessAPI_ML:
 
+    # Tempo de vida (segundos) das respostas em cache, por prefixo de endpoint
+    _CACHE_POLICIES = {
+        'sites/MLB/categories': 3600,
+        'sites/MLB/search': 300,
+        'items/': 300,
+        'orders/search': 10
+    }
+    _CACHE_MAXSIZE = 1024
+
+    # Endpoints cujas entradas expiradas são revalidadas com If-None-Match em vez de descartadas.
+    # Os detalhes de itens não entram aqui: vêm do multi-get "items?ids=...", cuja resposta agrega
+    # vários itens, e ficam em cache por item (get_items_details_batch) apenas com TTL.
+    _CACHEABLE_ETAG = {'sites/MLB/categories'}
+
+    # Arquivo onde os tokens são guardados entre execuções, por client_id (None mantém só em memória)
+    _TOKEN_CACHE_PATH = os.path.expanduser('~/.cache/ml_token.json')
+
+    # Maior offset aceito pela pesquisa; além dele é preciso usar search_type=scan
+    _MAX_OFFSET = 1000
+
+    def __init__(self, client_id, client_secret, refresh_token):
+        """
+        O construtor da classe que inicializa os atributos necessários para obter um token de acesso
+
+        Argumentos:
+            client_id: 
+            client_secret: chave secreta do aplicativo 
+            refresh_token:
+
+        Retorno:
+
+        """
+        self.base_url = "https://api.mercadolibre.com/"
+        self.user_agent = _USER_AGENT
+
+        # Sessão única reaproveitada entre as chamadas (keep-alive / pool de conexões)
+        self.session = requests.Session()
+        # 429 é tratado em _make_api_request (Retry-After); 5xx fica a cargo do adaptador
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504], raise_on_status=False)
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._bucket = _TokenBucket(capacity=10, refill_rate=10)
+
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._refresh_token = refresh_token
+        self._refresh_token_inicial = refresh_token
+        self._tokens = _TokenStore(self._TOKEN_CACHE_PATH, client_id)
+        self.access_token = None
+        self._token_expiry = 0
+        self._token_lock = threading.Lock()
+
+        # Cabeçalhos fixos ficam na sessão, evitando montar um dicionário a cada requisição
+        self.session.headers.update({
+            'User-Agent': self.user_agent,
+            'Accept': 'application/json',
+            'Accept-Encoding': _ACCEPT_ENCODING
+        })
+        self._refresh_access_token()
+
+    def _refresh_access_token(self, usar_cache=True, token_expirado=None):
+        """
+        Obtém um novo token de acesso e atualiza o cabeçalho Authorization da sessão.
+        O token em disco e a rotação do refresh_token ficam a cargo de _TokenStore.
+        A validade é guardada com 60 segundos de margem.
+
+        Várias threads podem pedir a renovação ao mesmo tempo; só a primeira a obter a trava
+        renova, as demais percebem que o token já mudou e retornam.
+
+        Argumentos:
+            usar_cache: False ignora o access_token em disco (ex.: após um 401); o refresh_token é sempre lido
+            token_expirado: token recusado pela API (401); sem ele, renova apenas se _token_expiry passou
+
+        Retorno:
+
+        """
+        with self._token_lock:
+            if token_expirado is None:
+                if time.monotonic() < self._token_expiry:
+                    return
+            elif self.access_token != token_expirado:
+                return
+            self._renovar_access_token(usar_cache)
+
+    def _renovar_access_token(self, usar_cache):
+        """
+        Renova o token de acesso; deve ser chamado com _token_lock adquirida.
+
+        Argumentos:
+            usar_cache: False ignora o access_token em disco
+
+        Retorno:
+
+        """
+        entrada = self._tokens.obter(
+            self._refresh_token_inicial,
+            lambda refresh_token: self._get_access_token(self._client_id, self._client_secret, refresh_token),
+            usar_cache
+        )
+        self._refresh_token = entrada['refresh_token']
+        self.access_token = entrada['access_token']
+        self._token_expiry = time.monotonic() + (entrada['expiry'] - time.time()) - 60
+        self.session.headers['Authorization'] = f'Bearer {self.access_token}'
+
+    def _get_access_token(self, client_id, client_secret, refresh_token):
+        """
+        Um método privado que faz uma solicitação HTTP POST para obter um token de acesso à API do Mercado Livre. 
+        Ele usa as credenciais do cliente abaixo para autenticação.
+
+        Argumentos:
+            client_id: 
+            client_secret: 
+            refresh_token: 
+
+        Retorno:
+            resposta do endpoint oauth/token (access_token, expires_in, refresh_token, ...)
+        """
+                
+        url = "https://api.mercadolibre.com/oauth/token"
+        payload = {
+            'grant_type': 'refresh_token',
+            'client_id': client_id,
+            'client_secret': client_secret,
+            'refresh_token': refresh_token
+        }
+        headers = {
+            'accept': 'application/json',
+            'content-type': 'application/x-www-form-urlencoded'
+        }
+        response = self.session.post(url, headers=headers, data=payload, timeout=(3, 30))
+        return orjson.loads(response.content)
+
+    def _make_api_request(self, endpoint, params=None):
+        """
+        Ele recebe um endpoint específico e parâmetros para a solicitação e usa o token de acesso para autenticar a solicitação
+
+        Argumentos:
+            endpoint: 
+
+        Retorno:
+
+        """
+        ttl = self._cache_ttl(endpoint, params)
+        usa_etag = ttl and any(self._endpoint_match(endpoint, prefixo) for prefixo in self._CACHEABLE_ETAG)
+        entrada = None
+        if ttl:
+            key = (endpoint, tuple(sorted((params or {}).items())))
+            # O cache guarda o corpo em bytes: cada chamada decodifica sua própria cópia, então
+            # alterar o resultado retornado não afeta as próximas chamadas
+            conteudo = self._cache_get(key, ttl)
+            if conteudo is not None:
+                return orjson.loads(conteudo)
+            if usa_etag:
+                entrada = self._cache_entry(key)
+
+        headers = {'If-None-Match': entrada[1]} if entrada and entrada[1] else None
+
+        if time.monotonic() >= self._token_expiry:
+            self._refresh_access_token()
+
+        url = self.base_url + endpoint
+        token = self.access_token
+
+        def get():
+            self._bucket.acquire()
+            return self.session.get(url, params=params, headers=headers, timeout=(3, 30))
+
+        response = get()
+        if response.status_code == 401:
+            self._refresh_access_token(usar_cache=False, token_expirado=token)
+            response = get()
+        if response.status_code == 429:
+            self._bucket.penalize()
+            time.sleep(self._retry_after(response))
+            response = get()
+        if response.status_code == 304 and entrada:
+            # Conteúdo não mudou: renova o tempo de vida da entrada sem baixar o corpo novamente
+            self._cache_set(key, entrada[2], entrada[1])
+            return orjson.loads(entrada[2])
+        if response.status_code == 200:
+            if ttl:
+                self._cache_set(key, response.content, response.headers.get('ETag') if usa_etag else None)
+            return orjson.loads(response.content)
+        else:
+            return None
+
+    @staticmethod
+    def _retry_after(response, padrao=1):
+        """
+        Lê o cabeçalho Retry-After de uma resposta 429.
+
+        Argumentos:
+            response: resposta HTTP
+            padrao: espera em segundos quando o cabeçalho está ausente ou inválido
+
+        Retorno:
+            tempo de espera em segundos
+        """
+        try:
+            return max(float(response.headers.get('Retry-After', padrao)), 0)
+        except ValueError:
+            return padrao
+
+    def _cache_ttl(self, endpoint, params):
+        """
+        Retorna o tempo de vida do cache para um endpoint, conforme _CACHE_POLICIES.
+        Pesquisas de pedidos só são cacheadas quando possuem intervalo de datas explícito;
+        endpoints de visitas e páginas de paginação (offset/scan) nunca são cacheados.
+
+        Argumentos:
+            endpoint: endpoint da requisição
+            params: parâmetros da requisição
+
+        Retorno:
+            ttl em segundos, ou None quando a resposta não deve ser cacheada
+        """
+        if endpoint == 'orders/search' and 'order.date_created.to' not in (params or {}):
+            return None
+        if 'search_type' in (params or {}):
+            # scroll_id é de uso único, não faz sentido reaproveitar a resposta
+            return None
+        if 'offset' in (params or {}):
+            # Páginas de uma paginação completa não ficam em cache, para que percorrer uma
+            # pesquisa longa não mantenha todas as páginas baixadas em memória
+            return None
+        if 'visits' in endpoint.split('/'):
+            # Visitas mudam ao longo do dia; não seguem a política de "items/"
+            return None
+        for prefixo, ttl in self._CACHE_POLICIES.items():
+            if self._endpoint_match(endpoint, prefixo):
+                return ttl
+        return None
+
+    @staticmethod
+    def _endpoint_match(endpoint, prefixo):
+        """
+        Verifica se um endpoint corresponde a uma entrada de configuração: igualdade exata, ou
+        prefixo quando a entrada termina com "/".
+
+        Argumentos:
+            endpoint: endpoint da requisição
+            prefixo: entrada de _CACHE_POLICIES ou _CACHEABLE_ETAG
+
+        Retorno:
+            True se corresponder
+        """
+        return endpoint == prefixo or (prefixo.endswith('/') and endpoint.startswith(prefixo))
+
+    def _cache_get(self, key, ttl):
+        """
+        Busca uma entrada no cache. Se o tempo de vida tiver expirado a entrada é descartada,
+        exceto quando possui ETag, caso em que é mantida para revalidação.
+
+        Argumentos:
+            key: chave da entrada
+            ttl: tempo de vida em segundos
+
+        Retorno:
+            valor armazenado, ou None se não houver entrada válida
+        """
+        with self._cache_lock:
+            entrada = self._cache.get(key)
+            if entrada is None:
+                return None
+            ts, etag, valor = entrada
+            if time.monotonic() - ts >= ttl:
+                if etag is None:
+                    del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return valor
+
+    def _cache_entry(self, key):
+        """
+        Retorna a entrada completa do cache, mesmo expirada.
+
+        Argumentos:
+            key: chave da entrada
+
+        Retorno:
+            tupla (ts, etag, valor), ou None
+        """
+        with self._cache_lock:
+            return self._cache.get(key)
+
+    def _cache_set(self, key, valor, etag=None):
+        """
+        Armazena uma entrada no cache, removendo a menos usada recentemente quando o limite é atingido.
+
+        Argumentos:
+            key: chave da entrada
+            valor: valor a ser armazenado
+            etag: ETag da resposta, usado para revalidar a entrada depois de expirada
+
+        Retorno:
+
+        """
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), etag, valor)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+
+    def _iter_paginas(self, endpoint, params, limit=50, max_workers=8):
+        """
+        Percorre as páginas de um endpoint de pesquisa. A primeira requisição informa o total
+        de resultados e as demais páginas são buscadas em paralelo. Quando o total passa do
+        offset máximo permitido, o restante é percorrido com _paged_scan; se o endpoint não
+        suportar scan, a paginação por offset continua até _MAX_OFFSET.
+
+        Argumentos:
+            endpoint: endpoint de pesquisa
+            params: parâmetros da consulta (sem limit/offset)
+            limit: quantidade de resultados por página
+            max_workers: quantidade de requisições simultâneas
+
+        Retorno:
+            gerador de tuplas (quantidade esperada de resultados, resultados da página), na ordem da paginação
+        """
+        response = self._make_api_request(endpoint, {**params, 'limit': limit, 'offset': 0})
+        if response is None:
+            return
+
+        total = response['paging']['total']
+        if total > self._MAX_OFFSET:
+            paginas = self._paged_scan(endpoint, {**params, 'limit': limit})
+            primeira = next(paginas, None)
+            if primeira is not None:
+                # O scan não segue a ordem da primeira página, então os itens dela são
+                # descartados das páginas seguintes
+                yield total, response['results']
+                vistos = {item.get('id') for item in response['results']}
+                for pagina in itertools.chain([primeira], paginas):
+                    yield total, [item for item in pagina if item.get('id') not in vistos]
+                return
+
+        # Sem scan, a paginação por offset não passa de _MAX_OFFSET resultados
+        esperado = min(total, self._MAX_OFFSET)
+        yield esperado, response['results']
+        offsets = iter(range(limit, esperado, limit))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def buscar(offset):
+                return executor.submit(self._make_api_request, endpoint, {**params, 'limit': limit, 'offset': offset})
+
+            # Janela limitada: no máximo max_workers páginas adiantadas em relação ao consumidor
+            pendentes = deque(buscar(offset) for offset in itertools.islice(offsets, max_workers))
+            try:
+                while pendentes:
+                    pagina = pendentes.popleft().result()
+                    proximo = next(offsets, None)
+                    if proximo is not None:
+                        pendentes.append(buscar(proximo))
+                    if pagina is not None:
+                        yield total, pagina['results']
+            finally:
+                # Consumidor parou antes do fim: não espera o download das páginas ainda na fila
+                for futuro in pendentes:
+                    futuro.cancel()
+
+    def _paginar(self, endpoint, params, limit=50):
+        """
+        Busca todas as páginas de um endpoint de pesquisa em uma única lista, alocada já com a
+        quantidade esperada de resultados para evitar realocações a cada página.
+
+        Argumentos:
+            endpoint: endpoint de pesquisa
+            params: parâmetros da consulta (sem limit/offset)
+            limit: quantidade de resultados por página
+
+        Retorno:
+            lista com os resultados de todas as páginas, na ordem da paginação
+        """
+        resultados = None
+        idx = 0
+        for esperado, pagina in self._iter_paginas(endpoint, params, limit):
+            if resultados is None:
+                resultados = [None] * esperado
+            resultados[idx:idx + len(pagina)] = pagina
+            idx += len(pagina)
+
+        if resultados is None:
+            return []
+
+        # A quantidade esperada vem do total estimado pela API; descarta posições não preenchidas
+        del resultados[idx:]
+        return resultados
+
+    def _paged_scan(self, endpoint, base_params):
+        """
+        Percorre todos os resultados de uma pesquisa usando search_type=scan. Cada página devolve um
+        scroll_id usado para pedir a próxima, com custo constante independente da profundidade e sem
+        o limite de offset da paginação comum.
+
+        Argumentos:
+            endpoint: endpoint de pesquisa
+            base_params: parâmetros da consulta
+
+        Retorno:
+            gerador com os resultados de cada página; não produz nada se o endpoint não suportar
+            scan (primeira resposta sem scroll_id)
+        """
+        params = {**base_params, 'search_type': 'scan'}
+        primeira = True
+        while True:
+            response = self._make_api_request(endpoint, params)
+            if response is None or not response.get('results'):
+                break
+            scroll_id = response.get('scroll_id')
+            if scroll_id is None and primeira:
+                break
+            yield response['results']
+            if scroll_id is None:
+                break
+            primeira = False
+            params = {**base_params, 'search_type': 'scan', 'scroll_id': scroll_id}
+
+    def close(self):
+        """
+        Encerra a sessão HTTP e libera as conexões mantidas no pool.
+
+        Argumentos:
+
+        Retorno:
+
+        """
+        self.session.close()
+
+    def get_vendas(self, seller_id, fields=None):
+        """
+        Retorna informações de vendas para um vendedor específico, usando o endpoint "orders/search" e parâmetros relacionados ao vendedor.
+
+        Argumentos:
+            seller_id: 
+            fields: campos a retornar (attributes); None retorna a resposta completa
+
+        Retorno:
+
+        """
+        endpoint = "orders/search"
+        params = {'seller': seller_id}
+        return self._make_api_request(endpoint, _com_atributos(params, fields))
+
+    def get_vendas_by_range(self, seller_id, dt_ini, dt_fim, fields=None):
+        """
+        Retorna informações de vendas para um vendedor em um intervalo de datas específico. 
+        Ele usa o mesmo endpoint "orders/search" e parâmetros para definir as datas de início e término.
+
+        Argumentos:
+            seller_id: 
+            dt_ini:
+            dt_fim:
+            fields: campos a retornar (attributes); None retorna a resposta completa
+
+        Retorno:
+
+        """
+        endpoint = "orders/search"
+        params = {
+            'seller': seller_id,
+            'order.date_created.from': _ORDER_DATE_FMT_FROM.format(dt_ini),
+            'order.date_created.to': _ORDER_DATE_FMT_TO.format(dt_fim)
+        }
+        return self._make_api_request(endpoint, _com_atributos(params, fields))
+
+    def get_produtos(self, palavra_chave, fields=None):
+        """
+        Retorna produtos com base em uma palavra-chave usando o endpoint "sites/MLB/search" e um parâmetro de consulta.
+
+        Argumentos:
+            palavra_chave:
+            fields: campos a retornar (attributes); None retorna a resposta completa
+
+        Retorno:
+
+        """
+        endpoint = "sites/MLB/search"
+        params = {'q': palavra_chave}
+        return self._make_api_request(endpoint, _com_atributos(params, fields))
+
+    def get_produtos_paginacao(self, palavra_chave, limit=50):
+        """
+        Retorna uma lista paginada de produtos com base em uma palavra-chave e limite de resultados. 
+        Ele faz várias solicitações para obter todos os resultados paginados.
+
+        Argumentos:
+            palavra_chave:
+
+        Retorno:
+
+        """
+        endpoint = "sites/MLB/search"
+        params = {'q': palavra_chave}
+        return self._paginar(endpoint, params, limit)
+
+    def iter_produtos(self, palavra_chave, limit=50):
+        """
+        Versão em gerador de get_produtos_paginacao: os produtos são entregues conforme as páginas
+        chegam, sem manter a lista completa em memória.
+
+        Argumentos:
+            palavra_chave:
+            limit: quantidade de resultados por página
+
+        Retorno:
+            gerador com os produtos encontrados
+        """
+        endpoint = "sites/MLB/search"
+        params = {'q': palavra_chave}
+        for _, pagina in self._iter_paginas(endpoint, params, limit):
+            yield from pagina
+
+    def get_items_details(self, id_produto):
+        """
+        Retorna detalhes de um item específico com base no seu ID. 
+        
+        Argumentos:
+            id_produto:
+
+        Retorno:
+            Ele usa o endpoint "items/{id_produto}" para obter informações como a data de início, o ID do vendedor e a quantidade vendida.
+            start_time: data de crição do anúncio
+            seller_id: código do vendedor
+            sold_quantity: quantidade de vendas do produto
+        """
+        return next(self.get_items_details_batch([id_produto]))
+
+    def get_items_details_batch(self, ids):
+        """
+        Retorna detalhes de vários itens usando o endpoint multi-get "items?ids=...", 
+        com até 20 itens por requisição.
+        
+        Argumentos:
+            ids: lista de códigos dos produtos
+
+        Retorno:
+            Gerador com uma tupla (start_time, seller_id, sold_quantity) por item, na ordem de ids.
+            Itens não encontrados retornam None.
+        """
+        ids = list(ids)
+        ttl = self._cache_ttl('items/', None)
+        for i in range(0, len(ids), 20):
+            chunk = ids[i:i + 20]
+            detalhes = {id_produto: self._cache_get(('get_items_details', id_produto), ttl) for id_produto in chunk}
+            faltantes = [id_produto for id_produto, valor in detalhes.items() if valor is None]
+            if faltantes:
+                params = {'ids': ','.join(faltantes), 'attributes': 'id,start_time,seller_id,sold_quantity'}
+                for item in self._make_api_request('items', params) or []:
+                    if item.get('code') != 200:
+                        continue
+                    dados = item['body']
+                    valor = dados['start_time'][:10], dados['seller_id'], dados['sold_quantity']
+                    detalhes[dados['id']] = valor
+                    self._cache_set(('get_items_details', dados['id']), valor)
+
+            for id_produto in chunk:
+                yield detalhes.get(id_produto)
+
+    def get_items_by_seller(self, id_seller, fields=None):
+        """
+        Retorna uma lista de itens de um vendedor específico, ordenados por preço ascendente.
+        
+        Argumentos:
+            id_seller: código do vendedor
+            fields: campos a retornar (attributes); None retorna a resposta completa
+
+        Retorno:
+
+        """
+        endpoint = "sites/MLB/search"
+        params = {'seller_id': id_seller, **_PRICE_ASC_PARAMS}
+        return self._make_api_request(endpoint, _com_atributos(params, fields))
+
+    def get_all_categories(self):
+        """
+        Retorna todas as categorias de produtos disponíveis no Mercado Livre.
+        
+        Argumentos:
+
+        Retorno:
+
+        """
+        endpoint = 'sites/MLB/categories'
+        return self._make_api_request(endpoint)
+
+    def get_items_by_category(self, categoria, fields=None):
+        """
+        Retorna uma lista de itens com base em uma categoria específica.
+        
+        Argumentos:
+            categoria: categoria do produto
+            fields: campos a retornar (attributes); None retorna a resposta completa
+
+        Retorno:
+
+        """
+        endpoint = "sites/MLB/search"
+        params = {'category': categoria}
+        return self._make_api_request(endpoint, _com_atributos(params, fields))
+
+    def get_items_by_category_paging(self, categoria, limit=50):
+        """
+        Retorna uma lista paginada de itens com base em uma categoria específica.
+        
+        Argumentos:
+            categoria: categoria do produto
+            limit: 
+        Retorno:
+
+        """
+        endpoint = "sites/MLB/search"
+        params = {'category': categoria}
+        return self._paginar(endpoint, params, limit)
+
+    def iter_items_by_category(self, categoria, limit=50):
+        """
+        Versão em gerador de get_items_by_category_paging: os itens são entregues conforme as páginas
+        chegam, sem manter a lista completa em memória.
+        
+        Argumentos:
+            categoria: categoria do produto
+            limit: quantidade de resultados por página
+
+        Retorno:
+            gerador com os itens da categoria
+        """
+        endpoint = "sites/MLB/search"
+        params = {'category': categoria}
+        for _, pagina in self._iter_paginas(endpoint, params, limit):
+            yield from pagina
+
+    def get_items_by_seller_category(self, seller_id, categoria):
+        """
+        Retorna itens de um vendedor específico dentro de uma categoria específica.
+        
+        Argumentos:
+            seller_id: código do vendedor
+            categoria: categoria do produto
+            
+        Retorno:
+
+        """
+        endpoint = "sites/MLB/search"
+        params = {'seller_id': seller_id, 'category': categoria}
+        return self._make_api_request(endpoint, params)
+
+    def get_visits_by_items(self, id_produto, dias, data_final):
+        """
+        Retorna informações de visitas a um item específico em um período de tempo específico.
+        
+        Argumentos:
+            id_produto: código do produto
+            dias: período a retornar ( 7 dias, 30 dias )
+            data_final: data a partir do qual será contado os dias para trás
+            
+        Retorno:
+
+        """
+        return next(self.get_visits_by_items_batch([id_produto], dias, data_final))
+
+    def get_visits_by_items_batch(self, ids, dias, data_final):
+        """
+        Retorna informações de visitas de vários itens em um período de tempo específico, usando o 
+        endpoint multi-item "items/visits/time_window?ids=...", com até 50 itens por requisição.
+        
+        Argumentos:
+            ids: lista de códigos dos produtos
+            dias: período a retornar ( 7 dias, 30 dias )
+            data_final: data a partir do qual será contado os dias para trás
+            
+        Retorno:
+            Gerador com as visitas de cada item, na ordem de ids. Itens sem resposta retornam None.
+        """
+        ids = list(ids)
+        endpoint = 'items/visits/time_window'
+        for i in range(0, len(ids), 50):
+            chunk = ids[i:i + 50]
+            params = {'ids': ','.join(chunk), 'last': dias, 'unit': 'day', 'ending': data_final}
+            visitas = {item['item_id']: item for item in self._make_api_request(endpoint, params) or []}
+            for id_produto in chunk:
+                yield visitas.get(id_produto)
+
+    def get_selled_items_by_seller(self, seller_id):
+        """
+        Retorna itens vendidos por um vendedor específico com status "paid" (pago).
+        
+        Argumentos:
+            seller_id: código do vendedor
+            
+        Retorno:
+
+        """
+        endpoint = "orders/search"
+        params = {'seller': seller_id, **_PAID_PARAMS}
+        return self._make_api_request(endpoint, params)
+
+
+class AsyncAccessAPI_ML:
+    """
+    Versão assíncrona de AccessAPI_ML, baseada em aiohttp, para fluxos com muitas requisições simultâneas.
+    Deve ser usada como gerenciador de contexto assíncrono:
+
+        async with AsyncAccessAPI_ML(client_id, client_secret, refresh_token) as api:
+            detalhes = await api.get_items_details_many(ids)
+    """
+
+    # Mesmo arquivo de tokens da versão síncrona
+    _TOKEN_CACHE_PATH = AccessAPI_ML._TOKEN_CACHE_PATH
+
+    # Maior offset aceito pela pesquisa
+    _MAX_OFFSET = AccessAPI_ML._MAX_OFFSET
+
     def __init__(self, client_id, client_secret, refresh_token):
         """
-        O construtor da classe que inicializa os atributos necessários para obter um token de acesso
+        O construtor da classe que armazena as credenciais. A sessão e o token de acesso são obtidos em __aenter__.
 
         Argumentos:
             client_id: 
@@ -20,83 +1056,171 @@ class AccessAPI_ML:
         Retorno:
 
         """
-        self.access_token = self._get_access_token(client_id, client_secret, refresh_token)
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_token = refresh_token
+        self._tokens = _TokenStore(self._TOKEN_CACHE_PATH, client_id)
         self.base_url = "https://api.mercadolibre.com/"
-        self.user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36"
+        self.user_agent = _USER_AGENT
+        self.session = None
+        self.access_token = None
+        self._bucket = _TokenBucket(capacity=10, refill_rate=10)
 
-    def _get_access_token(self, client_id, client_secret, refresh_token):
+    async def __aenter__(self):
+        if aiohttp is None:
+            raise ImportError("AsyncAccessAPI_ML requer o pacote aiohttp")
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={'User-Agent': self.user_agent, 'Accept': 'application/json', 'Accept-Encoding': _ACCEPT_ENCODING}
+        )
+        try:
+            self.access_token = await self._get_access_token()
+        except BaseException:
+            await self.session.close()
+            raise
+        self.session.headers['Authorization'] = f'Bearer {self.access_token}'
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
         """
-        Um método privado que faz uma solicitação HTTP POST para obter um token de acesso à API do Mercado Livre. 
-        Ele usa as credenciais do cliente abaixo para autenticação.
+        Encerra a sessão HTTP e libera as conexões do conector.
 
         Argumentos:
-            client_id: 
-            client_secret: 
-            refresh_token: 
 
         Retorno:
 
         """
-                
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _get_access_token(self):
+        """
+        Obtém o token de acesso pelo mesmo _TokenStore de AccessAPI_ML, compartilhando o arquivo de
+        tokens e a rotação do refresh_token com a versão síncrona. A trava de arquivo é bloqueante,
+        então a renovação roda em uma thread; o POST em si continua sendo feito no event loop.
+
+        Argumentos:
+
+        Retorno:
+            access_token
+        """
+        loop = asyncio.get_running_loop()
+
+        def solicitar(refresh_token):
+            return asyncio.run_coroutine_threadsafe(self._solicitar_token(refresh_token), loop).result()
+
+        entrada = await loop.run_in_executor(None, self._tokens.obter, self.refresh_token, solicitar)
+        return entrada['access_token']
+
+    async def _solicitar_token(self, refresh_token):
+        """
+        Um método privado que faz uma solicitação HTTP POST para obter um token de acesso à API do Mercado Livre.
+
+        Argumentos:
+            refresh_token: 
+
+        Retorno:
+            resposta do endpoint oauth/token (access_token, expires_in, refresh_token, ...)
+        """
         url = "https://api.mercadolibre.com/oauth/token"
         payload = {
             'grant_type': 'refresh_token',
-            'client_id': client_id,
-            'client_secret': client_secret,
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
             'refresh_token': refresh_token
         }
         headers = {
             'accept': 'application/json',
             'content-type': 'application/x-www-form-urlencoded'
         }
-        response = requests.post(url, headers=headers, data=payload)
-        token = response.json()
-        return token['access_token']
+        async with self.session.post(url, headers=headers, data=payload) as response:
+            return await response.json(loads=orjson.loads, content_type=None)
 
-    def _make_api_request(self, endpoint, params=None):
+    async def _make_api_request(self, endpoint, params=None):
         """
-        Ele recebe um endpoint específico e parâmetros para a solicitação e usa o token de acesso para autenticar a solicitação
+        Faz uma requisição GET autenticada no endpoint informado.
 
         Argumentos:
             endpoint: 
+            params:
 
         Retorno:
-
+            resposta decodificada, ou None quando o status não é 200
         """
         url = self.base_url + endpoint
-        headers = {
-            'Authorization': self.access_token,
-            'User-Agent': self.user_agent
-        }
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return None
+        await self._bucket.acquire_async()
+        async with self.session.get(url, params=params) as response:
+            if response.status == 429:
+                self._bucket.penalize()
+            if response.status == 200:
+                return await response.json(loads=orjson.loads)
+            else:
+                return None
 
-    def get_vendas(self, seller_id):
+    async def _paginar(self, endpoint, params, limit=50, max_workers=8):
         """
-        Retorna informações de vendas para um vendedor específico, usando o endpoint "orders/search" e parâmetros relacionados ao vendedor.
+        Busca todas as páginas de um endpoint de pesquisa. A primeira requisição informa o total
+        de resultados e as demais páginas são buscadas simultaneamente, no máximo max_workers por vez.
+        A paginação por offset para em _MAX_OFFSET; para percorrer mais resultados use
+        AccessAPI_ML, que recorre a search_type=scan.
+
+        Argumentos:
+            endpoint: endpoint de pesquisa
+            params: parâmetros da consulta (sem limit/offset)
+            limit: quantidade de resultados por página
+            max_workers: quantidade de requisições simultâneas
+
+        Retorno:
+            lista com os resultados de todas as páginas, na ordem da paginação
+        """
+        response = await self._make_api_request(endpoint, {**params, 'limit': limit, 'offset': 0})
+        if response is None:
+            return []
+
+        semaforo = asyncio.Semaphore(max_workers)
+
+        async def buscar(offset):
+            async with semaforo:
+                return await self._make_api_request(endpoint, {**params, 'limit': limit, 'offset': offset})
+
+        resultados = list(response['results'])
+        total = min(response['paging']['total'], self._MAX_OFFSET)
+        paginas = await asyncio.gather(*(buscar(offset) for offset in range(limit, total, limit)))
+        for pagina in paginas:
+            if pagina is not None:
+                resultados.extend(pagina['results'])
+
+        return resultados
+
+    async def get_vendas(self, seller_id, fields=None):
+        """
+        Retorna informações de vendas para um vendedor específico.
 
         Argumentos:
             seller_id: 
+            fields: campos a retornar (attributes); None retorna a resposta completa
 
         Retorno:
 
         """
         endpoint = "orders/search"
-        params = {'seller': seller_id, 'access_token': self.access_token}
-        return self._make_api_request(endpoint, params)
+        params = {'seller': seller_id}
+        return await self._make_api_request(endpoint, _com_atributos(params, fields))
 
-    def get_vendas_by_range(self, seller_id, dt_ini, dt_fim):
+    async def get_vendas_by_range(self, seller_id, dt_ini, dt_fim, fields=None):
         """
-        Retorna informações de vendas para um vendedor em um intervalo de datas específico. 
-        Ele usa o mesmo endpoint "orders/search" e parâmetros para definir as datas de início e término.
+        Retorna informações de vendas para um vendedor em um intervalo de datas específico.
 
         Argumentos:
             seller_id: 
             dt_ini:
             dt_fim:
+            fields: campos a retornar (attributes); None retorna a resposta completa
 
         Retorno:
 
@@ -104,184 +1228,209 @@ class AccessAPI_ML:
         endpoint = "orders/search"
         params = {
             'seller': seller_id,
-            'order.date_created.from': f'{dt_ini}T00:00:00.000-00:00',
-            'order.date_created.to': f'{dt_fim}T23:59:59.000-00:00',
-            'access_token': self.access_token
+            'order.date_created.from': _ORDER_DATE_FMT_FROM.format(dt_ini),
+            'order.date_created.to': _ORDER_DATE_FMT_TO.format(dt_fim)
         }
-        return self._make_api_request(endpoint, params)
+        return await self._make_api_request(endpoint, _com_atributos(params, fields))
 
-    def get_produtos(self, palavra_chave):
+    async def get_produtos(self, palavra_chave, fields=None):
         """
-        Retorna produtos com base em uma palavra-chave usando o endpoint "sites/MLB/search" e um parâmetro de consulta.
+        Retorna produtos com base em uma palavra-chave.
 
         Argumentos:
             palavra_chave:
+            fields: campos a retornar (attributes); None retorna a resposta completa
 
         Retorno:
 
         """
         endpoint = "sites/MLB/search"
         params = {'q': palavra_chave}
-        return self._make_api_request(endpoint, params)
+        return await self._make_api_request(endpoint, _com_atributos(params, fields))
 
-    def get_produtos_paginacao(self, palavra_chave, limit=50):
+    async def get_produtos_paginacao(self, palavra_chave, limit=50):
         """
-        Retorna uma lista paginada de produtos com base em uma palavra-chave e limite de resultados. 
-        Ele faz várias solicitações para obter todos os resultados paginados.
+        Retorna uma lista paginada de produtos com base em uma palavra-chave e limite de resultados.
 
         Argumentos:
             palavra_chave:
+            limit:
 
         Retorno:
 
         """
         endpoint = "sites/MLB/search"
-        offset = 0
-        resultados = []
-        while True:
-
-          params = {'q': palavra_chave, 'limit': limit, 'offset': 0}
-          response = self._make_api_request(endpoint, params)
-          if response is not None:
-            resultados.extend(response['results'])
-            offset += limit
-
-            if offset >= response['paging']['total']:
-              break
-            else:
-              break
-
-        return resultados
+        params = {'q': palavra_chave}
+        return await self._paginar(endpoint, params, limit)
 
-    def get_items_details(self, id_produto):
+    async def get_items_details(self, id_produto):
         """
-        Retorna detalhes de um item específico com base no seu ID. 
-        
+        Retorna detalhes de um item específico com base no seu ID.
+
         Argumentos:
             id_produto:
 
         Retorno:
-            Ele usa o endpoint "items/{id_produto}" para obter informações como a data de início, o ID do vendedor e a quantidade vendida.
             start_time: data de crição do anúncio
             seller_id: código do vendedor
             sold_quantity: quantidade de vendas do produto
         """
-        endpoint = f'items/{id_produto}'
-        #return self._make_api_request(endpoint)
-        dados = self._make_api_request(endpoint)
-        return dados['start_time'][:10], dados['seller_id'], dados['sold_quantity']
+        detalhes = await self.get_items_details_many([id_produto])
+        return detalhes[0]
+
+    async def get_items_details_many(self, ids):
+        """
+        Retorna detalhes de vários itens usando o endpoint multi-get "items?ids=...".
+        Os grupos de 20 itens são buscados simultaneamente.
+
+        Argumentos:
+            ids: lista de códigos dos produtos
+
+        Retorno:
+            lista com uma tupla (start_time, seller_id, sold_quantity) por item, na ordem de ids.
+            Itens não encontrados retornam None.
+        """
+        ids = list(ids)
+        chunks = [ids[i:i + 20] for i in range(0, len(ids), 20)]
+        respostas = await asyncio.gather(*(
+            self._make_api_request('items', {'ids': ','.join(chunk), 'attributes': 'id,start_time,seller_id,sold_quantity'})
+            for chunk in chunks
+        ))
+
+        detalhes = {}
+        for resposta in respostas:
+            for item in resposta or []:
+                if item.get('code') != 200:
+                    continue
+                dados = item['body']
+                detalhes[dados['id']] = dados['start_time'][:10], dados['seller_id'], dados['sold_quantity']
 
-    def get_items_by_seller(self, id_seller):
+        return [detalhes.get(id_produto) for id_produto in ids]
+
+    async def get_items_by_seller(self, id_seller, fields=None):
         """
         Retorna uma lista de itens de um vendedor específico, ordenados por preço ascendente.
-        
+
         Argumentos:
             id_seller: código do vendedor
+            fields: campos a retornar (attributes); None retorna a resposta completa
 
         Retorno:
 
         """
         endpoint = "sites/MLB/search"
-        params = {'seller_id': id_seller, 'sort': 'price_asc'}
-        return self._make_api_request(endpoint, params)
+        params = {'seller_id': id_seller, **_PRICE_ASC_PARAMS}
+        return await self._make_api_request(endpoint, _com_atributos(params, fields))
 
-    def get_all_categories(self):
+    async def get_all_categories(self):
         """
         Retorna todas as categorias de produtos disponíveis no Mercado Livre.
-        
+
         Argumentos:
 
         Retorno:
 
         """
         endpoint = 'sites/MLB/categories'
-        return self._make_api_request(endpoint)
+        return await self._make_api_request(endpoint)
 
-    def get_items_by_category(self, categoria):
+    async def get_items_by_category(self, categoria, fields=None):
         """
         Retorna uma lista de itens com base em uma categoria específica.
-        
+
         Argumentos:
             categoria: categoria do produto
+            fields: campos a retornar (attributes); None retorna a resposta completa
 
         Retorno:
 
         """
         endpoint = "sites/MLB/search"
         params = {'category': categoria}
-        return self._make_api_request(endpoint, params)
+        return await self._make_api_request(endpoint, _com_atributos(params, fields))
 
-    def get_items_by_category_paging(self, categoria, limit=50):
+    async def get_items_by_category_paging(self, categoria, limit=50):
         """
         Retorna uma lista paginada de itens com base em uma categoria específica.
-        
+
         Argumentos:
             categoria: categoria do produto
             limit: 
+
         Retorno:
 
         """
         endpoint = "sites/MLB/search"
-        offset = 0
-        resultados = []
-
-        while True:
-
-            params = {'category': categoria, 'limit': limit, 'offset': 0}
-            response = self._make_api_request(endpoint, params)
-
-            if response is not None:
-                resultados.extend(response['results'])
-                offset += limit
-
-                if offset >= response['paging']['total']:
-                    break
-            else:
-                break
-
-        return resultados
+        params = {'category': categoria}
+        return await self._paginar(endpoint, params, limit)
 
-    def get_items_by_seller_category(self, seller_id, categoria):
+    async def get_items_by_seller_category(self, seller_id, categoria):
         """
         Retorna itens de um vendedor específico dentro de uma categoria específica.
-        
+
         Argumentos:
             seller_id: código do vendedor
             categoria: categoria do produto
-            
+
         Retorno:
 
         """
         endpoint = "sites/MLB/search"
         params = {'seller_id': seller_id, 'category': categoria}
-        return self._make_api_request(endpoint, params)
+        return await self._make_api_request(endpoint, params)
 
-    def get_visits_by_items(self, id_produto, dias, data_final):
+    async def get_visits_by_items(self, id_produto, dias, data_final):
         """
         Retorna informações de visitas a um item específico em um período de tempo específico.
-        
+
         Argumentos:
             id_produto: código do produto
             dias: período a retornar ( 7 dias, 30 dias )
             data_final: data a partir do qual será contado os dias para trás
-            
+
         Retorno:
 
         """
-        endpoint = f'items/{id_produto}/visits/time_window'
-        params = {'last': dias, 'unit': 'day', 'ending': data_final}
-        return self._make_api_request(endpoint, params)
+        visitas = await self.get_visits_by_items_many([id_produto], dias, data_final)
+        return visitas[0]
 
-    def get_selled_items_by_seller(self, seller_id):
+    async def get_visits_by_items_many(self, ids, dias, data_final):
+        """
+        Retorna informações de visitas de vários itens usando o endpoint multi-item 
+        "items/visits/time_window?ids=...". Os grupos de 50 itens são buscados simultaneamente.
+
+        Argumentos:
+            ids: lista de códigos dos produtos
+            dias: período a retornar ( 7 dias, 30 dias )
+            data_final: data a partir do qual será contado os dias para trás
+
+        Retorno:
+            lista com as visitas de cada item, na ordem de ids. Itens sem resposta retornam None.
+        """
+        ids = list(ids)
+        endpoint = 'items/visits/time_window'
+        respostas = await asyncio.gather(*(
+            self._make_api_request(endpoint, {'ids': ','.join(ids[i:i + 50]), 'last': dias, 'unit': 'day', 'ending': data_final})
+            for i in range(0, len(ids), 50)
+        ))
+
+        visitas = {}
+        for resposta in respostas:
+            for item in resposta or []:
+                visitas[item['item_id']] = item
+
+        return [visitas.get(id_produto) for id_produto in ids]
+
+    async def get_selled_items_by_seller(self, seller_id):
         """
         Retorna itens vendidos por um vendedor específico com status "paid" (pago).
-        
+
         Argumentos:
             seller_id: código do vendedor
-            
+
         Retorno:
 
         """
         endpoint = "orders/search"
-        params = {'seller': seller_id, 'order.status': 'paid'}
-        return self._make_api_request(endpoint, params)
\ No newline at end of file
+        params = {'seller': seller_id, **_PAID_PARAMS}
+        return await self._make_api_request(endpoint, params)